@@ -4,6 +4,7 @@ import uuid
 from typing import List, Optional
 
 from fastapi import Depends, BackgroundTasks, HTTPException, UploadFile, File, APIRouter
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.db.db import get_db
@@ -11,6 +12,7 @@ from backend.models.import_job_response import ImportJobResponse
 from backend.models.task_create import TaskCreate
 from backend.models.task_response import TaskResponse
 from backend.tables import BulkImportJob, Task
+from backend.utility.export_csv import stream_tasks_csv
 from backend.utility.process_csv import process_csv_import
 from backend.utility.send_notification import send_notification
 from backend.utility.verify_token import verify_token
@@ -31,6 +33,28 @@ async def get_tasks(
     return tasks
 
 
+@router.get("/export.csv")
+async def export_tasks_csv(
+        completed: Optional[bool] = None,
+        gzip: bool = False,
+        db: Session = Depends(get_db),
+        token: str = Depends(verify_token)
+):
+    """Stream tasks as CSV in the bulk import format with optional filtering"""
+    query = db.query(Task)
+    if completed is not None:
+        query = query.filter(Task.completed == completed)
+    query = query.order_by(Task.due_date.asc())
+
+    filename = "tasks.csv.gz" if gzip else "tasks.csv"
+    media_type = "application/gzip" if gzip else "text/csv"
+    return StreamingResponse(
+        stream_tasks_csv(query, gzip=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 @router.post("/", response_model=TaskResponse)
 async def create_task(
         task: TaskCreate,
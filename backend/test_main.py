@@ -4,6 +4,8 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime, timedelta
+import csv
+import gzip
 import os
 import io
 
@@ -185,6 +187,54 @@ Task 3,Description 3,user3@example.com,{},low""".format(
         assert response.status_code == 400
         assert "File must be a CSV" in response.json()["detail"]
 
+    def test_export_tasks_csv(self, setup_database):
+        """Test CSV export uses the bulk import column layout and filters"""
+        task_data = {
+            "title": "Export Me",
+            "description": "Exported, with a comma",
+            "assigned_to_email": "test@example.com",
+            "due_date": (datetime.now() + timedelta(days=1)).replace(microsecond=0).isoformat(),
+            "priority": "high"
+        }
+        client.post("/tasks", json=task_data, headers=headers)
+
+        task_data["title"] = "Done Already"
+        task_data["description"] = None
+        done_id = client.post("/tasks", json=task_data, headers=headers).json()["id"]
+        client.patch(f"/tasks/{done_id}/complete", headers=headers)
+
+        response = client.get("/tasks/export.csv", params={"completed": False}, headers=headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert list(rows[0].keys()) == ["title", "description", "assigned_to_email", "due_date", "priority"]
+        assert len(rows) == 1
+        assert rows[0]["title"] == "Export Me"
+        assert rows[0]["description"] == "Exported, with a comma"
+        assert rows[0]["due_date"] == task_data["due_date"]
+        assert rows[0]["priority"] == "high"
+
+    def test_export_tasks_csv_gzip(self, setup_database):
+        """Test gzip compressed CSV export"""
+        task_data = {
+            "title": "Zipped",
+            "assigned_to_email": "test@example.com",
+            "due_date": (datetime.now() + timedelta(days=1)).isoformat(),
+            "priority": "low"
+        }
+        client.post("/tasks", json=task_data, headers=headers)
+
+        response = client.get("/tasks/export.csv", params={"gzip": True}, headers=headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert "tasks.csv.gz" in response.headers["content-disposition"]
+
+        rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode('utf-8'))))
+        assert len(rows) == 1
+        assert rows[0]["title"] == "Zipped"
+        assert rows[0]["description"] == ""
+
     def test_get_nonexistent_import_job(self, setup_database):
         """Test getting status of non-existent import job"""
         response = client.get("/import-jobs/fake-id", headers=headers)
@@ -0,0 +1,51 @@
+import csv
+import io
+import zlib
+from typing import Iterator
+
+from sqlalchemy.orm import Query
+
+from backend.tables import Task
+
+# Same column layout that process_csv_import reads, so exports can be re-imported
+CSV_COLUMNS = ["title", "description", "assigned_to_email", "due_date", "priority"]
+EXPORT_BATCH_SIZE = 1000
+
+
+def stream_tasks_csv(query: Query, gzip: bool = False) -> Iterator[bytes]:
+    """Stream tasks from a query as CSV chunks, optionally gzip compressed"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # wbits=31 writes a gzip header/trailer instead of a raw zlib stream
+    compressor = zlib.compressobj(wbits=31) if gzip else None
+
+    def flush() -> bytes:
+        chunk = buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate(0)
+        return compressor.compress(chunk) if compressor else chunk
+
+    writer.writerow(CSV_COLUMNS)
+    chunk = flush()
+    if chunk:
+        yield chunk
+
+    # yield_per fetches rows from a server-side cursor in batches instead of loading them all
+    for row_num, task in enumerate(query.yield_per(EXPORT_BATCH_SIZE), 1):
+        writer.writerow([
+            task.title,
+            task.description or "",
+            task.assigned_to_email,
+            task.due_date.isoformat(),
+            task.priority.value
+        ])
+        if row_num % EXPORT_BATCH_SIZE == 0:
+            chunk = flush()
+            if chunk:
+                yield chunk
+
+    chunk = flush()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk